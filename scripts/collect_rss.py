@@ -9,23 +9,95 @@ Usage:
 """
 
 import argparse
+import asyncio
+import email.utils
+import hashlib
+import io
+import json
+import multiprocessing
+import os
+import pickle
 import re
 import sys
 import time
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
+from functools import lru_cache, partial
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable, Iterator
+from urllib.parse import urljoin
 
+import aiohttp
 import feedparser
 import yaml
+from lxml import etree
+
+# libyaml 付きの PyYAML なら C 実装のローダーを使う
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
 
 # 日本標準時
-JST = timezone(timedelta(hours=9))
+JST_OFFSET = timedelta(hours=9)
+JST = timezone(JST_OFFSET)
 
 # 曜日名（日本語）
 WEEKDAY_JA = ["月", "火", "水", "木", "金", "土", "日"]
 
+# カテゴリの出力順（公式 → 国内 → 海外 → 技術 → Reddit → 業界）
+CATEGORY_ORDER = (
+    "official",
+    "domestic",
+    "international",
+    "tech",
+    "reddit",
+    "industry",
+    "other",
+)
+
+# HTMLタグ・連続空白の除去用
+_TAG_RE = re.compile(r"<[^>]+>")
+_WS_RE = re.compile(r"\s+")
+
+# feedparser のサニタイザと同様に中身ごと捨てる要素（エスケープされた HTML 内）
+_SCRIPT_STYLE_RE = re.compile(r"<(script|style)\b.*?</\1\s*>", re.I | re.S)
+
+# URL の重複判定で無視するトラッキング用クエリパラメータ
+_TRACKER_RE = re.compile(r"[?&](?:utm_[^=&#]+|ref|fbclid|gclid)=[^&#]*")
+
+# lxml による高速パスで扱う要素（RSS 2.0 / RSS 1.0 / Atom）
+_ATOM_NS = "{http://www.w3.org/2005/Atom}"
+_RSS1_NS = "{http://purl.org/rss/1.0/}"
+_DC_DATE = "{http://purl.org/dc/elements/1.1/}date"
+_CONTENT_ENCODED = "{http://purl.org/rss/1.0/modules/content/}encoded"
+_ITEM_TAGS = ("item", f"{_RSS1_NS}item", f"{_ATOM_NS}entry")
+
+# User-Agent（Reddit等がデフォルトUAをブロックするため）
+USER_AGENT = "my-news-collector/1.0 (https://github.com/chayatokyo/my-news-collector)"
+
+# HTTP 接続設定（全フィードで1つのセッションを共有し keep-alive で再利用）
+CONNECTION_LIMIT = 50
+CONNECTION_LIMIT_PER_HOST = 6
+DNS_CACHE_TTL = 300
+CONNECT_TIMEOUT = 5
+FETCH_TIMEOUT = 15
+
+# 接続エラー・タイムアウト時の再試行（backoff_factor * 2^n 秒待機）
+FETCH_RETRIES = 2
+RETRY_BACKOFF = 0.3
+
+# 条件付きGET（ETag / Last-Modified）用のキャッシュ
+CACHE_DIR = Path.home() / ".cache" / "my-news-collector"
+CACHE_INDEX_PATH = CACHE_DIR / "index.json"
+
+# パース用スレッド数の上限（config の max_workers で上書き可）
+MAX_PARSE_WORKERS = 32
+
+# これ以上の大きさのフィードは GIL を避けてプロセスプールでパースする
+# （小さいフィードはプロセス間の pickle コストの方が大きい）
+PROCESS_PARSE_MIN_BYTES = 64 * 1024
+
 
 def load_config(config_path: str) -> dict[str, Any]:
     """YAML設定ファイルを読み込む"""
@@ -35,152 +107,547 @@ def load_config(config_path: str) -> dict[str, Any]:
         sys.exit(1)
 
     with open(path, encoding="utf-8") as f:
-        return yaml.safe_load(f)
+        return yaml.load(f, Loader=SafeLoader)
 
 
-def parse_entry_date(entry: feedparser.FeedParserDict) -> datetime | None:
-    """フィードエントリの公開日時をパースする"""
-    for attr in ("published_parsed", "updated_parsed"):
-        parsed = getattr(entry, attr, None)
-        if parsed:
-            try:
-                return datetime(*parsed[:6], tzinfo=timezone.utc)
-            except (ValueError, TypeError):
-                continue
-    return None
+def parse_entry_date(parsed: time.struct_time | None) -> datetime | None:
+    """エントリの *_parsed（UTC struct_time）を datetime に変換する"""
+    if parsed is None:
+        return None
+    try:
+        return datetime(*parsed[:6], tzinfo=timezone.utc)
+    except (ValueError, TypeError):
+        return None
+
 
+def _canon(url: str) -> str:
+    """重複判定用にURLを正規化する（トラッキングパラメータ・フラグメント除去、小文字化）"""
+    base = url.partition("#")[0]
+    key = _TRACKER_RE.sub("", base)
+    if "?" in base and "?" not in key:
+        # 先頭のパラメータだけが除去された場合、残りの "&" を "?" に戻す
+        key = key.replace("&", "?", 1)
+    # 末尾スラッシュはクエリの有無にかかわらずパス部分から除く
+    path, sep, query = key.partition("?")
+    return f"{path.rstrip('/')}{sep}{query}".rstrip("?&").lower()
 
-def matches_keywords(text: str, keywords: list[str]) -> bool:
+
+def build_keyword_pattern(keywords: list[str]) -> re.Pattern[str] | None:
+    """キーワード群を大文字小文字を区別しない1つの正規表現にまとめる"""
+    if not keywords:
+        return None
+    return re.compile("|".join(re.escape(kw) for kw in keywords), re.IGNORECASE)
+
+
+def matches_keywords(text: str, pattern: re.Pattern[str] | None) -> bool:
     """テキストがキーワードのいずれかに合致するか判定"""
-    lower_text = text.lower()
-    return any(kw.lower() in lower_text for kw in keywords)
+    return pattern is not None and pattern.search(text) is not None
+
+
+def _element_text(elem: etree._Element | None) -> str:
+    """要素内のテキストを連結して返す（子要素を含む xhtml にも対応）"""
+    if elem is None:
+        return ""
+    return "".join(elem.itertext()).strip()
 
 
-def matches_exclude_keywords(text: str, exclude_keywords: list[str]) -> bool:
-    """テキストが除外キーワードのいずれかに合致するか判定"""
-    if not exclude_keywords:
-        return False
-    lower_text = text.lower()
-    return any(kw.lower() in lower_text for kw in exclude_keywords)
+def _markup_text(elem: etree._Element | None) -> str:
+    """タイトル・要約のテキストを返す（script/style は feedparser と同様に中身ごと除く）"""
+    if elem is None:
+        return ""
+    # xhtml の子要素として埋め込まれたもの
+    etree.strip_elements(elem, "{*}script", "{*}style", with_tail=False)
+    # エスケープされた HTML として埋め込まれたもの
+    return _SCRIPT_STYLE_RE.sub("", _element_text(elem))
 
 
-def fetch_single_feed(
+def _parse_feed_date(text: str) -> time.struct_time | None:
+    """
+    RFC 822 / ISO 8601 形式の日時を UTC の struct_time に変換する。
+    それ以外の形式は feedparser の日付パーサに任せる。
+    """
+    if not text:
+        return None
+    try:
+        dt = email.utils.parsedate_to_datetime(text)
+    except (TypeError, ValueError):
+        try:
+            dt = datetime.fromisoformat(text)
+        except ValueError:
+            # 解釈できない日付を None にすると日付フィルタを素通りしてしまう。
+            # 非公開APIのため、無くなった場合は AttributeError を送出して
+            # フィード全体を feedparser に任せる（parse_feed_body 参照）
+            return feedparser.datetimes._parse_date(text)
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return dt.utctimetuple()
+
+
+def _resolve_link(elem: etree._Element | None, link: str, base_url: str) -> str:
+    """相対URLを xml:base またはフィードのURLを基準に絶対URLにする"""
+    if not link or elem is None:
+        return link
+    base = elem.base
+    return urljoin(urljoin(base_url, base) if base else base_url, link)
+
+
+def _atom_link(item: etree._Element, base_url: str) -> str:
+    """Atom エントリの記事URL（rel="alternate" の href）を返す"""
+    for link in item.iterfind(f"{_ATOM_NS}link"):
+        if link.get("rel", "alternate") == "alternate":
+            return _resolve_link(link, link.get("href", ""), base_url)
+    # feedparser と同様、URL 形式の id を記事URLとして扱う
+    entry_id = _element_text(item.find(f"{_ATOM_NS}id"))
+    if entry_id.startswith(("http://", "https://")):
+        return entry_id
+    return ""
+
+
+def parse_feed_fast(body: bytes, base_url: str) -> list[dict[str, Any]] | None:
+    """
+    lxml でフィードをストリーミング解析し、feedparser 互換のキーを持つ
+    エントリを返す。記事要素が見つからなければ None（feedparser に任せる）。
+    相対リンクは base_url（フィードのURL）を基準に解決する。
+    不正な XML の場合は etree.XMLSyntaxError を送出する。
+    """
+    entries: list[dict[str, Any]] = []
+    for _, item in etree.iterparse(
+        io.BytesIO(body), events=("end",), tag=_ITEM_TAGS, resolve_entities=False
+    ):
+        if item.tag == f"{_ATOM_NS}entry":
+            summary = item.find(f"{_ATOM_NS}summary")
+            if summary is None:
+                summary = item.find(f"{_ATOM_NS}content")
+            entry = {
+                "title": _markup_text(item.find(f"{_ATOM_NS}title")),
+                "link": _atom_link(item, base_url),
+                "summary": _markup_text(summary),
+                "published_parsed": _parse_feed_date(
+                    _element_text(item.find(f"{_ATOM_NS}published"))
+                ),
+                "updated_parsed": _parse_feed_date(
+                    _element_text(item.find(f"{_ATOM_NS}updated"))
+                ),
+            }
+        else:
+            ns = _RSS1_NS if item.tag.startswith(_RSS1_NS) else ""
+            summary = item.find(f"{ns}description")
+            if summary is None:
+                summary = item.find(_CONTENT_ENCODED)
+            link_elem = item.find(f"{ns}link")
+            link = _element_text(link_elem)
+            if not link:
+                # feedparser と同様、パーマリンクの guid を記事URLとして扱う
+                link_elem = item.find("guid")
+                if (
+                    link_elem is not None
+                    and link_elem.get("isPermaLink", "true") == "true"
+                ):
+                    link = _element_text(link_elem)
+            link = _resolve_link(link_elem, link, base_url)
+            entry = {
+                "title": _markup_text(item.find(f"{ns}title")),
+                "link": link,
+                "summary": _markup_text(summary),
+                "published_parsed": _parse_feed_date(
+                    _element_text(item.find("pubDate"))
+                ),
+                "updated_parsed": _parse_feed_date(
+                    _element_text(item.find(_DC_DATE))
+                ),
+            }
+        entries.append(entry)
+
+        # 処理済みの要素を解放してメモリを一定に保つ
+        item.clear()
+        while item.getprevious() is not None:
+            del item.getparent()[0]
+
+    return entries or None
+
+
+def parse_feed_body(
+    body: bytes, headers: dict[str, str], url: str
+) -> tuple[list[dict[str, Any]], str | None]:
+    """
+    フィード本文をパースする。(entries, error) を返す。
+    整形式の RSS/Atom は lxml で処理し、それ以外は feedparser にフォールバックする。
+    """
+    try:
+        entries = parse_feed_fast(body, url)
+    except etree.XMLSyntaxError:
+        entries = None
+    except AttributeError:
+        # feedparser.datetimes._parse_date が使えない版では feedparser に任せる
+        entries = None
+    if entries is not None:
+        return entries, None
+
+    parsed = feedparser.parse(body, response_headers=headers)
+    if parsed.bozo and not parsed.entries:
+        return [], f"Parse error: {parsed.bozo_exception}"
+    return parsed.entries, None
+
+
+def filter_entries(
+    entries: list[dict[str, Any]],
     feed_config: dict[str, str],
-) -> tuple[str, list[feedparser.FeedParserDict], str | None]:
-    """単一のRSSフィードを取得する。(name, entries, error) を返す"""
+    cutoff_tuple: tuple[int, ...],
+    include_re: re.Pattern[str] | None,
+    exclude_re: re.Pattern[str] | None,
+) -> list[tuple[str, dict[str, str]]]:
+    """
+    エントリを日付・キーワードで絞り込み、記事に変換する。
+    Returns: [(url_key, article)]（URL の重複排除は呼び出し側で行う）
+    """
     name = feed_config["name"]
-    url = feed_config["url"]
+    category = feed_config.get("category", "other")
+    language = feed_config.get("language", "en")
+
+    articles: list[tuple[str, dict[str, str]]] = []
+    for entry in entries:
+        # 日付フィルタ（最も安価な判定を先に行い、古い記事は datetime を作らない）
+        parsed = entry.get("published_parsed") or entry.get("updated_parsed")
+        if parsed and parsed[:6] < cutoff_tuple:
+            continue
+
+        url = entry.get("link", "")
+        if not url:
+            continue
+
+        # テキストを結合してキーワードフィルタ
+        title = entry.get("title", "")
+        summary = entry.get("summary", "")
+        combined_text = f"{title} {summary}"
+
+        # 除外キーワードチェック
+        if matches_keywords(combined_text, exclude_re):
+            continue
+
+        # キーワードマッチ
+        if not matches_keywords(combined_text, include_re):
+            continue
+
+        # datetime の生成は出力する記事に限る
+        pub_date = parse_entry_date(parsed)
+        if pub_date:
+            # UTC 基準の datetime に固定オフセットを足すだけで JST 表記になる
+            jst = pub_date + JST_OFFSET
+            published = (
+                f"{jst.year:04d}-{jst.month:02d}-{jst.day:02d} "
+                f"{jst.hour:02d}:{jst.minute:02d}"
+            )
+        else:
+            published = "不明"
+
+        # トラッキングパラメータ違いは同一記事とみなすため正規化したキーを添える
+        articles.append(
+            (
+                _canon(url),
+                {
+                    "title": clean_text(title),
+                    "url": url,
+                    "source": name,
+                    "category": category,
+                    "language": language,
+                    "published": published,
+                    "summary": clean_text(summary)[:200],
+                },
+            )
+        )
+    return articles
+
+
+def parse_and_filter(
+    body: bytes,
+    headers: dict[str, str],
+    pickle_path: str | None,
+    feed_config: dict[str, str],
+    entry_filter: Callable[..., list[tuple[str, dict[str, str]]]],
+) -> tuple[list[tuple[str, dict[str, str]]], str | None]:
+    """
+    フィード本文をパース・キャッシュ保存・絞り込みまで行う（ワーカー側で実行）。
+    生のエントリはワーカー内で破棄され、残った記事だけを返す。
+    Returns: (articles, error)
+    """
+    entries, error = parse_feed_body(body, headers, feed_config["url"])
+    if error:
+        return [], error
+    if pickle_path:
+        _store_cached_entries(pickle_path, entries)
+    return entry_filter(entries, feed_config), None
+
+
+def load_and_filter(
+    pickle_path: str,
+    feed_config: dict[str, str],
+    entry_filter: Callable[..., list[tuple[str, dict[str, str]]]],
+) -> list[tuple[str, dict[str, str]]] | None:
+    """キャッシュ済みエントリを読み込んで絞り込む。読めなければ None"""
+    entries = _load_cached_entries(pickle_path)
+    if entries is None:
+        return None
+    return entry_filter(entries, feed_config)
+
+
+def load_feed_cache() -> dict[str, dict[str, str]]:
+    """フィードごとの ETag / Last-Modified キャッシュを読み込む"""
+    try:
+        with open(CACHE_INDEX_PATH, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def save_feed_cache(cache: dict[str, dict[str, str]]) -> None:
+    """
+    フィードごとの ETag / Last-Modified キャッシュを書き出し、
+    どのレコードからも参照されなくなったエントリのキャッシュを削除する
+    """
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        with open(CACHE_INDEX_PATH, "w", encoding="utf-8") as f:
+            json.dump(cache, f, ensure_ascii=False, indent=2)
+        referenced = {record["entries_pickle_path"] for record in cache.values()}
+        for path in CACHE_DIR.glob("*.pickle"):
+            if str(path) not in referenced:
+                path.unlink(missing_ok=True)
+    except OSError as e:
+        print(f"Warning: Failed to write feed cache: {e}", file=sys.stderr)
+
+
+def _load_cached_entries(pickle_path: str) -> list[dict[str, Any]] | None:
+    """キャッシュ済みのエントリを読み込む。読めなければ None"""
+    try:
+        with open(pickle_path, "rb") as f:
+            return pickle.load(f)
+    except (OSError, pickle.UnpicklingError, EOFError):
+        return None
+
+
+def _store_cached_entries(pickle_path: str, entries: list[dict[str, Any]]) -> None:
+    """エントリを保存する（失敗しても次回フル取得になるだけなので無視）"""
     try:
-        # User-Agent を設定（Reddit等がブロックするため）
-        parsed = feedparser.parse(
-            url,
-            agent="my-news-collector/1.0 (https://github.com/chayatokyo/my-news-collector)",
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        with open(pickle_path, "wb") as f:
+            pickle.dump(entries, f, protocol=pickle.HIGHEST_PROTOCOL)
+    except OSError:
+        pass
+
+
+def _cache_record(url: str, headers: dict[str, str]) -> dict[str, str] | None:
+    """レスポンスヘッダからキャッシュのレコードを作る。検証子が無ければ None"""
+    etag = headers.get("etag")
+    last_modified = headers.get("last-modified")
+    if not etag and not last_modified:
+        return None
+
+    path = CACHE_DIR / f"{hashlib.sha1(url.encode('utf-8')).hexdigest()}.pickle"
+    record = {"entries_pickle_path": str(path)}
+    if etag:
+        record["etag"] = etag
+    if last_modified:
+        record["last_modified"] = last_modified
+    return record
+
+
+async def _request_body(
+    session: aiohttp.ClientSession, url: str, cached: dict[str, str] | None
+) -> tuple[int, bytes, dict[str, str]]:
+    """GET リクエストを1回発行する。(status, body, response_headers) を返す"""
+    headers = {"User-Agent": USER_AGENT}
+    if cached:
+        if "etag" in cached:
+            headers["If-None-Match"] = cached["etag"]
+        if "last_modified" in cached:
+            headers["If-Modified-Since"] = cached["last_modified"]
+
+    async with session.get(
+        url,
+        headers=headers,
+        timeout=aiohttp.ClientTimeout(total=FETCH_TIMEOUT, connect=CONNECT_TIMEOUT),
+    ) as resp:
+        resp.raise_for_status()
+        body = await resp.read()
+        # feedparser は小文字のヘッダ名で Content-Type 等を参照する
+        return (
+            resp.status,
+            body,
+            {k.lower(): v for k, v in resp.headers.items()},
         )
-        if parsed.bozo and not parsed.entries:
-            return (name, [], f"Parse error: {parsed.bozo_exception}")
-        return (name, parsed.entries, None)
+
+
+async def _fetch_body(
+    session: aiohttp.ClientSession, url: str, cached: dict[str, str] | None
+) -> tuple[int, bytes, dict[str, str]]:
+    """フィードの本文を取得する（一時的な失敗は再試行）"""
+    for attempt in range(FETCH_RETRIES):
+        try:
+            return await _request_body(session, url, cached)
+        except (aiohttp.ClientConnectionError, asyncio.TimeoutError):
+            await asyncio.sleep(RETRY_BACKOFF * (2**attempt))
+    return await _request_body(session, url, cached)
+
+
+async def fetch_single_feed(
+    session: aiohttp.ClientSession,
+    cpu_pool: ProcessPoolExecutor,
+    feed_config: dict[str, str],
+    cached: dict[str, str] | None,
+    entry_filter: Callable[..., list[tuple[str, dict[str, str]]]],
+) -> tuple[str, list[tuple[str, dict[str, str]]], str | None, dict[str, str] | None]:
+    """
+    単一のRSSフィードを取得・絞り込みする。
+    Returns: (name, [(url_key, article)], error, cache_record)
+    """
+    name = feed_config["name"]
+    url = feed_config["url"]
+    try:
+        status, body, headers = await _fetch_body(session, url, cached)
+        if status == 304 and cached:
+            # 未更新: 前回パースしたエントリを再利用する
+            articles = await asyncio.to_thread(
+                load_and_filter,
+                cached["entries_pickle_path"],
+                feed_config,
+                entry_filter,
+            )
+            if articles is not None:
+                # 304 でも検証子が更新されることがあるため反映する
+                record = dict(cached)
+                if "etag" in headers:
+                    record["etag"] = headers["etag"]
+                if "last-modified" in headers:
+                    record["last_modified"] = headers["last-modified"]
+                return (name, articles, None, record)
+            status, body, headers = await _fetch_body(session, url, None)
+
+        record = _cache_record(url, headers)
+        pickle_path = record["entries_pickle_path"] if record else None
+
+        # 本文だけ渡すと基準URIが無く相対リンクを解決できないため、取得元URLを渡す
+        headers["content-location"] = urljoin(url, headers.get("content-location", ""))
+
+        # パースはCPU処理のためイベントループの外で行う
+        if len(body) >= PROCESS_PARSE_MIN_BYTES:
+            articles, error = await asyncio.get_running_loop().run_in_executor(
+                cpu_pool,
+                parse_and_filter,
+                body,
+                headers,
+                pickle_path,
+                feed_config,
+                entry_filter,
+            )
+        else:
+            articles, error = await asyncio.to_thread(
+                parse_and_filter, body, headers, pickle_path, feed_config, entry_filter
+            )
+        if error:
+            return (name, [], error, None)
+        return (name, articles, None, record)
     except Exception as e:
-        return (name, [], str(e))
+        return (name, [], str(e) or type(e).__name__, None)
 
 
-def collect_articles(
+async def collect_articles_async(
     config: dict[str, Any], target_date: datetime
-) -> tuple[list[dict[str, str]], list[dict[str, str]]]:
+) -> tuple[dict[str, list[dict[str, str]]], list[dict[str, str]]]:
     """
     全フィードから記事を収集・フィルタリングする。
-    Returns: (articles, errors)
+    Returns: (articles_by_category, errors)
     """
     feeds = config.get("feeds", [])
     keywords = config.get("keywords", [])
     exclude_keywords = config.get("exclude_keywords", [])
     fetch_hours = config.get("fetch_hours", 48)
     cutoff_time = target_date - timedelta(hours=fetch_hours)
+    # feedparser の *_parsed (UTC struct_time) とタプルのまま比較するための境界
+    cutoff_tuple = tuple(cutoff_time.astimezone(timezone.utc).timetuple()[:6])
+
+    # 全キーワードを1回の検索で判定できるよう事前にコンパイルし、
+    # 絞り込み条件ごとワーカーに渡す
+    entry_filter = partial(
+        filter_entries,
+        cutoff_tuple=cutoff_tuple,
+        include_re=build_keyword_pattern(keywords),
+        exclude_re=build_keyword_pattern(exclude_keywords),
+    )
 
-    articles: list[dict[str, str]] = []
+    # カテゴリごとに出力順で記事を振り分ける（ソート不要）
+    buckets: dict[str, list[dict[str, str]]] = {cat: [] for cat in CATEGORY_ORDER}
     errors: list[dict[str, str]] = []
     seen_urls: set[str] = set()
+    progress_lines: list[str] = []
 
     print(f"Fetching {len(feeds)} feeds...")
 
+    # asyncio.to_thread が使うスレッドプールをフィード数に合わせる
+    workers = config.get("max_workers") or min(max(len(feeds), 1), MAX_PARSE_WORKERS)
+    asyncio.get_running_loop().set_default_executor(
+        ThreadPoolExecutor(max_workers=workers, thread_name_prefix="rss-parse")
+    )
+
     # 並列でフィードを取得
-    with ThreadPoolExecutor(max_workers=10) as executor:
-        futures = {
-            executor.submit(fetch_single_feed, feed): feed for feed in feeds
-        }
-        for future in as_completed(futures):
-            feed_config = futures[future]
-            name, entries, error = future.result()
-
-            if error:
-                errors.append({"name": name, "error": error})
-                print(f"  ✗ {name}: {error}")
+    connector = aiohttp.TCPConnector(
+        limit=CONNECTION_LIMIT,
+        limit_per_host=CONNECTION_LIMIT_PER_HOST,
+        ttl_dns_cache=DNS_CACHE_TTL,
+    )
+    cache = load_feed_cache()
+    # 今回の設定にあるフィードだけでキャッシュを作り直す（削除されたフィードは残さない）
+    new_cache: dict[str, dict[str, str]] = {}
+    # スレッドを持つ親プロセスからの fork は危険なため spawn で起動する
+    cpu_pool = ProcessPoolExecutor(
+        max_workers=os.cpu_count(), mp_context=multiprocessing.get_context("spawn")
+    )
+    with cpu_pool:
+        async with aiohttp.ClientSession(connector=connector) as session:
+            results = await asyncio.gather(
+                *(
+                    fetch_single_feed(
+                        session, cpu_pool, feed, cache.get(feed["url"]), entry_filter
+                    )
+                    for feed in feeds
+                )
+            )
+
+    for feed_config, (name, feed_articles, error, cache_record) in zip(feeds, results):
+        if cache_record:
+            new_cache[feed_config["url"]] = cache_record
+
+        if error:
+            errors.append({"name": name, "error": error})
+            progress_lines.append(f"  ✗ {name}: {error}")
+            continue
+
+        # カテゴリはフィード単位なので振り分け先もフィードごとに一度だけ引く
+        # （未知のカテゴリは既知カテゴリの後ろに追加される）
+        bucket = buckets.setdefault(feed_config.get("category", "other"), [])
+
+        # URL の重複チェック（フィードをまたぐためメインで行う）
+        per_feed: list[dict[str, str]] = []
+        for url_key, article in feed_articles:
+            if url_key in seen_urls:
                 continue
+            seen_urls.add(url_key)
+            per_feed.append(article)
 
-            feed_article_count = 0
-            for entry in entries:
-                # URL の重複チェック
-                url = getattr(entry, "link", "")
-                if not url or url in seen_urls:
-                    continue
-
-                # 日付フィルタ
-                pub_date = parse_entry_date(entry)
-                if pub_date and pub_date < cutoff_time:
-                    continue
-
-                # テキストを結合してキーワードフィルタ
-                title = getattr(entry, "title", "")
-                summary = getattr(entry, "summary", "")
-                combined_text = f"{title} {summary}"
-
-                # 除外キーワードチェック
-                if matches_exclude_keywords(combined_text, exclude_keywords):
-                    continue
-
-                # キーワードマッチ
-                if not matches_keywords(combined_text, keywords):
-                    continue
-
-                seen_urls.add(url)
-                feed_article_count += 1
-                articles.append(
-                    {
-                        "title": clean_text(title),
-                        "url": url,
-                        "source": name,
-                        "category": feed_config.get("category", "other"),
-                        "language": feed_config.get("language", "en"),
-                        "published": (
-                            pub_date.astimezone(JST).strftime("%Y-%m-%d %H:%M")
-                            if pub_date
-                            else "不明"
-                        ),
-                        "summary": clean_text(summary)[:200],
-                    }
-                )
+        bucket.extend(per_feed)
+        progress_lines.append(f"  ✓ {name}: {len(per_feed)} articles")
 
-            print(f"  ✓ {name}: {feed_article_count} articles")
-
-    # カテゴリ優先度でソート（公式 → 国内 → 海外 → 技術 → Reddit → 業界）
-    category_order = {
-        "official": 0,
-        "domestic": 1,
-        "international": 2,
-        "tech": 3,
-        "reddit": 4,
-        "industry": 5,
-        "other": 6,
-    }
-    articles.sort(key=lambda a: category_order.get(a["category"], 99))
+    # フィードごとの進捗はまとめて1回で書き出す
+    sys.stdout.write("".join(f"{line}\n" for line in progress_lines))
 
-    return articles, errors
+    save_feed_cache(new_cache)
 
+    return buckets, errors
 
+
+@lru_cache(maxsize=4096)
 def clean_text(text: str) -> str:
-    """HTMLタグ除去・空白整理"""
-    text = re.sub(r"<[^>]+>", "", text)
-    text = re.sub(r"\s+", " ", text).strip()
-    return text
+    """HTMLタグ除去・空白整理（同一ソースの定型文が多いためキャッシュ）"""
+    return _WS_RE.sub(" ", _TAG_RE.sub("", text)).strip()
 
 
 def category_label(category: str) -> str:
@@ -197,54 +664,50 @@ def category_label(category: str) -> str:
     return labels.get(category, category)
 
 
-def generate_markdown(
+def iter_markdown_lines(
     config: dict[str, Any],
-    articles: list[dict[str, str]],
+    articles_by_category: dict[str, list[dict[str, str]]],
     errors: list[dict[str, str]],
     target_date: datetime,
-) -> str:
-    """Markdownファイルのコンテンツを生成する"""
+) -> Iterator[str]:
+    """Markdownファイルのコンテンツを1行ずつ生成する"""
     date_str = target_date.strftime("%Y-%m-%d")
     weekday = WEEKDAY_JA[target_date.weekday()]
     date_jp = f"{target_date.year}年{target_date.month}月{target_date.day}日（{weekday}）"
 
-    lines: list[str] = []
-    lines.append(f"# AI News — {date_jp}")
-    lines.append("")
-    lines.append(
-        f"> 自動収集: {len(articles)} 件 / エラー: {len(errors)} 件"
-    )
-    lines.append(f"> 収集時刻: {datetime.now(JST).strftime('%Y-%m-%d %H:%M JST')}")
-    lines.append("")
+    yield f"# AI News — {date_jp}"
+    yield ""
+    total = sum(len(items) for items in articles_by_category.values())
+    yield f"> 自動収集: {total} 件 / エラー: {len(errors)} 件"
+    yield f"> 収集時刻: {datetime.now(JST).strftime('%Y-%m-%d %H:%M JST')}"
+    yield ""
 
-    if not articles:
-        lines.append("本日の該当記事はありませんでした。")
-        lines.append("")
+    if not total:
+        yield "本日の該当記事はありませんでした。"
+        yield ""
     else:
-        # カテゴリごとにグループ化
-        current_category = ""
-        for article in articles:
-            if article["category"] != current_category:
-                current_category = article["category"]
-                lines.append(f"## {category_label(current_category)}")
-                lines.append("")
-
-            lines.append(f"- [ ] [{article['title']} | {article['source']}]({article['url']})")
-            if article["summary"]:
-                lines.append(f"      {article['summary'][:150]}")
-            lines.append("")
+        # カテゴリごとに出力（振り分け済みの順序のまま）
+        for category, items in articles_by_category.items():
+            if not items:
+                continue
+            yield f"## {category_label(category)}"
+            yield ""
+
+            for article in items:
+                yield f"- [ ] [{article['title']} | {article['source']}]({article['url']})"
+                if article["summary"]:
+                    yield f"      {article['summary'][:150]}"
+                yield ""
 
     # エラー情報
     if errors:
-        lines.append("---")
-        lines.append("")
-        lines.append("## ⚠ 取得エラー")
-        lines.append("")
+        yield "---"
+        yield ""
+        yield "## ⚠ 取得エラー"
+        yield ""
         for err in errors:
-            lines.append(f"- **{err['name']}**: {err['error']}")
-        lines.append("")
-
-    return "\n".join(lines)
+            yield f"- **{err['name']}**: {err['error']}"
+        yield ""
 
 
 def main() -> None:
@@ -278,23 +741,28 @@ def main() -> None:
 
     # 記事収集
     start_time = time.time()
-    articles, errors = collect_articles(config, target_date)
+    articles_by_category, errors = asyncio.run(
+        collect_articles_async(config, target_date)
+    )
     elapsed = time.time() - start_time
 
     print()
-    print(f"Results: {len(articles)} articles collected in {elapsed:.1f}s")
+    total = sum(len(items) for items in articles_by_category.values())
+    print(f"Results: {total} articles collected in {elapsed:.1f}s")
     print(f"Errors: {len(errors)} feeds failed")
 
-    # Markdown 生成
-    markdown = generate_markdown(config, articles, errors, target_date)
+    # Markdown 生成（全体を1つの文字列にせず行単位で書き出す）
+    lines = iter_markdown_lines(config, articles_by_category, errors, target_date)
 
     # 出力ディレクトリの作成
     output_dir = Path(config.get("output", {}).get("directory", f"output/{collection_name}"))
     output_dir.mkdir(parents=True, exist_ok=True)
 
     output_path = output_dir / f"{date_str}.md"
-    with open(output_path, "w", encoding="utf-8") as f:
-        f.write(markdown)
+    with open(output_path, "w", encoding="utf-8", buffering=1 << 16) as f:
+        # "\n".join(lines) と同じ出力になるよう2行目以降の前に改行を置く
+        f.write(next(lines, ""))
+        f.writelines("\n" + line for line in lines)
 
     print(f"Output: {output_path}")
 